@@ -1,19 +1,189 @@
 import argparse
+import asyncio
+import functools
 import logging
 import json
+import re
 from typing import Any, Dict, List, Optional
+import time
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 import os
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 from pydantic import AnyUrl
-import ast
-from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    # orjson is a declared dependency, but fall back to stdlib json so the
+    # server still runs without it
+    orjson = None
 
 logger = logging.getLogger('mcp_aws_resources_server')
 
+# Statement keywords that modify data or schema and are rejected by
+# validate_query
+_DISALLOWED_KEYWORDS = frozenset({
+    'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'CREATE',
+    'TRUNCATE', 'MERGE', 'GRANT', 'REVOKE', 'VACUUM'
+})
+
+# Read-only statement prefixes accepted by validate_query; checked with a
+# single startswith call against a bounded upper-cased slice of the query
+_ALLOWED_PREFIXES = (
+    'SELECT ', 'WITH ', 'SHOW ', 'DESCRIBE ', 'SHOW DATABASES', 'EXPLAIN '
+)
+
+# Compiled once at import so query validation doesn't recompile the pattern
+# per call; case-insensitive so the query never needs to be upper-cased
+_DISALLOWED_RE = re.compile(
+    r'\b(' + '|'.join(sorted(_DISALLOWED_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+
+# Client configuration sized for concurrent tool calls: a connection pool
+# matching the thread pool, adaptive (token-bucket) retries for Athena API
+# throttling, and keepalive so pooled TLS connections survive between calls
+_ATHENA_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60
+)
+
+# This server exposes no resources; the discovery handlers return this shared
+# list so frequent MCP discovery calls don't allocate a fresh one each time
+_EMPTY_RESOURCES: List[types.Resource] = []
+
+# The tool catalog is constant, so build it once at import instead of on
+# every MCP list_tools request
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="aws_athena_query",
+        description="Execute an Athena SQL query and return the execution details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_string": {
+                    "type": "string",
+                    "description": "The SQL query to execute in Athena"
+                },
+                "workgroup": {
+                    "type": "string",
+                    "description": "The Athena workgroup to use. If not provided, uses the server's configured default."
+                },
+                "output_location": {
+                    "type": "string",
+                    "description": "S3 location to store query results. If not provided, uses the server's configured default."
+                },
+                "wait_for_completion": {
+                    "type": "boolean",
+                    "description": "Whether to wait for query completion",
+                    "default": False
+                }
+            },
+            "required": ["query_string"]
+        },
+    ),
+    types.Tool(
+        name="aws_athena_query_batch",
+        description="Execute multiple Athena SQL queries concurrently and return the execution details for each",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The SQL queries to execute in Athena"
+                },
+                "workgroup": {
+                    "type": "string",
+                    "description": "The Athena workgroup to use. If not provided, uses the server's configured default."
+                },
+                "output_location": {
+                    "type": "string",
+                    "description": "S3 location to store query results. If not provided, uses the server's configured default."
+                },
+                "wait_for_completion": {
+                    "type": "boolean",
+                    "description": "Whether to wait for all queries to complete",
+                    "default": False
+                }
+            },
+            "required": ["queries"]
+        },
+    ),
+    types.Tool(
+        name="aws_athena_get_query_results",
+        description="Get the results of a previously executed Athena query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_execution_id": {
+                    "type": "string",
+                    "description": "The execution ID of the query to get results for"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 1000
+                }
+            },
+            "required": ["query_execution_id"]
+        },
+    )
+]
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_query(query_string: str) -> Optional[str]:
+    """
+    Validation core, memoized on the raw query string
+
+    Dashboard-style clients re-send identical queries, so cache hits skip
+    the prefix check and keyword scan entirely. Kept at module scope because
+    lru_cache on a method would pin the querier instance.
+
+    Returns:
+        Optional[str]: Error message if validation fails, None if it passes
+    """
+    # Check if query starts with SELECT or SHOW or DESCRIBE; slicing to
+    # 20 chars caps the upper() cost regardless of query length, and the
+    # tuple form of startswith checks every prefix in one C-level call
+    if not query_string.lstrip()[:20].upper().startswith(_ALLOWED_PREFIXES):
+        return "Security restriction: Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are allowed"
+
+    # Additional security check for common SQL injection patterns
+    match = _DISALLOWED_RE.search(query_string)
+    if match:
+        return f"Security restriction: Query contains disallowed keyword: {match.group(1).upper()}"
+
+    # If we get here, validation passed
+    return None
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize datetimes and other non-JSON boto3 response types"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default).decode('utf-8')
+    # Match orjson's output on the fallback path: MCP stdio is UTF-8, so
+    # skip the \uXXXX escape pass, and drop the whitespace after separators
+    return json.dumps(
+        obj, default=_json_default, ensure_ascii=False, separators=(',', ':')
+    )
+
 
 def parse_arguments() -> argparse.Namespace:
     """Use argparse to allow values to be set as CLI switches
@@ -48,41 +218,21 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-class CodeExecutor(ast.NodeTransformer):
-    """Custom AST NodeTransformer to validate and transform the code"""
-
-    def __init__(self):
-        self.has_result = False
-        self.imported_modules = set()
-
-    def visit_Assign(self, node):
-        """Track if 'result' variable is assigned"""
-        for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == 'result':
-                self.has_result = True
-        return node
-
-    def visit_Import(self, node):
-        """Track imported modules"""
-        for alias in node.names:
-            self.imported_modules.add(alias.name)
-        return node
-
-    def visit_ImportFrom(self, node):
-        """Track imported modules"""
-        self.imported_modules.add(node.module)
-        return node
-
 class AWSResourceQuerier:
-    def __init__(self, 
-                 access_key_id=None, 
-                 secret_access_key=None, 
-                 session_token=None, 
-                 profile=None, 
-                 region='us-east-1', 
-                 athena_workgroup='primary', 
-                 athena_output_location='s3://aws-athena-query-results-qa-ue1/query-results/'):
-        """Initialize AWS session using provided parameters"""
+    def __init__(self,
+                 access_key_id: Optional[str] = None,
+                 secret_access_key: Optional[str] = None,
+                 session_token: Optional[str] = None,
+                 profile: Optional[str] = None,
+                 region: str = 'us-east-1',
+                 athena_workgroup: str = 'primary',
+                 athena_output_location: str = 's3://aws-athena-query-results-qa-ue1/query-results/'):
+        """Initialize AWS session using provided parameters
+
+        CLI/environment parsing happens once in main(); the constructor only
+        receives plain values, so instances can be created in tests without
+        touching argparse or the environment.
+        """
         self.session = boto3.Session(
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
@@ -91,10 +241,21 @@ class AWSResourceQuerier:
             region_name=region
         )
         
-        # Store Athena configuration
+        # Store Athena configuration; normalize the output location to end
+        # with a slash once, so per-call result paths are plain concatenation
         self.athena_workgroup = athena_workgroup
+        if not athena_output_location.endswith('/'):
+            athena_output_location += '/'
         self.athena_output_location = athena_output_location
 
+        # Build the Athena client once; creating a client parses the service
+        # model each time, so reusing it avoids that cost on every tool call
+        self.athena_client = self.session.client('athena', config=_ATHENA_CLIENT_CONFIG)
+
+        # Shared pool for running blocking boto3 calls off the event loop;
+        # boto3 clients are thread-safe for concurrent operations
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='athena')
+
         if (not profile and
                 (not access_key_id or not secret_access_key)):
             logger.warning("AWS credentials not found in environment variables")
@@ -109,36 +270,9 @@ class AWSResourceQuerier:
         Returns:
             dict or None: Error dictionary if validation fails, None if validation passes
         """
-        # Validate query is SELECT only
-        normalized_query = query_string.strip().upper()
-        
-        # Check if query starts with SELECT or SHOW or DESCRIBE
-        if not (normalized_query.startswith('SELECT ') or 
-               normalized_query.startswith('WITH ') or 
-               normalized_query.startswith('SHOW ') or 
-               normalized_query.startswith('DESCRIBE ') or
-               normalized_query == 'SHOW DATABASES' or
-               normalized_query.startswith('EXPLAIN ')):
-            return {
-                "error": "Security restriction: Only SELECT, SHOW, DESCRIBE, and EXPLAIN queries are allowed"
-            }
-            
-        # Additional security check for common SQL injection patterns
-        disallowed_keywords = [
-            'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'CREATE', 
-            'TRUNCATE', 'MERGE', 'GRANT', 'REVOKE', 'VACUUM'
-        ]
-        
-        # Check for disallowed keywords in the query
-        for keyword in disallowed_keywords:
-            pattern = r'\b' + keyword + r'\b'
-            import re
-            if re.search(pattern, normalized_query):
-                return {
-                    "error": f"Security restriction: Query contains disallowed keyword: {keyword}"
-                }
-        
-        # If we get here, validation passed
+        error = _validate_query(query_string)
+        if error is not None:
+            return {"error": error}
         return None
         
     def execute_athena_query(self, query_string: str, workgroup: str = None, 
@@ -156,19 +290,23 @@ class AWSResourceQuerier:
         Returns:
             dict: Query execution details including execution ID and result location
         """
+        # Validate the query before computing defaults or touching the
+        # client, so rejected queries return without any further work
+        if (validation_error := self.validate_query(query_string)) is not None:
+            return validation_error
+
         try:
-            # Use server defaults if parameters are not provided
+            # Use server defaults if parameters are not provided; the server
+            # default is already normalized, only overrides need the check
             workgroup = workgroup or self.athena_workgroup
-            output_location = output_location or self.athena_output_location
-            
-            # Validate the query
-            validation_error = self.validate_query(query_string)
-            if validation_error:
-                return validation_error
-            
-            # Create Athena client
-            athena_client = self.session.client('athena')
-            
+            if output_location is None:
+                output_location = self.athena_output_location
+            elif not output_location.endswith('/'):
+                output_location += '/'
+
+            # Reuse the cached Athena client
+            athena_client = self.athena_client
+
             # Execute the query
             response = athena_client.start_query_execution(
                 QueryString=query_string,
@@ -181,43 +319,88 @@ class AWSResourceQuerier:
             query_execution_id = response['QueryExecutionId']
             result = {
                 'QueryExecutionId': query_execution_id,
-                'OutputLocation': f"{output_location}{query_execution_id}.csv"
+                'OutputLocation': output_location + query_execution_id + '.csv'
             }
             
             # Optionally wait for query completion
             if wait_for_completion:
-                import time
-                
-                # Check query status
-                status = 'RUNNING'
-                max_retries = 100
-                retry_count = 0
-                
-                while status in ['QUEUED', 'RUNNING'] and retry_count < max_retries:
-                    status_response = athena_client.get_query_execution(
-                        QueryExecutionId=query_execution_id
-                    )
-                    status = status_response['QueryExecution']['Status']['State']
-                    
-                    if status in ['QUEUED', 'RUNNING']:
-                        time.sleep(1)  # Wait 1 second before checking again
-                    retry_count += 1
-                
-                result['Status'] = status
-                
-                # Get results if query succeeded
-                if status == 'SUCCEEDED':
-                    results_response = athena_client.get_query_results(
-                        QueryExecutionId=query_execution_id
-                    )
-                    result['Results'] = results_response
-            
+                result.update(self._wait_for_query(query_execution_id))
+
             return result
             
         except Exception as e:
             logger.error(f"Error executing Athena query: {str(e)}")
             return {"error": str(e)}
-            
+
+    def execute_athena_queries(self, queries: List[str], workgroup: str = None,
+                               output_location: str = None,
+                               wait_for_completion: bool = False) -> List[dict]:
+        """
+        Execute multiple Athena queries concurrently
+
+        Athena submissions are I/O-bound, so running them through a thread
+        pool makes wall-clock time scale with the slowest query rather than
+        the sum of all of them.
+
+        Args:
+            queries (List[str]): The SQL queries to execute (SELECT queries only)
+            workgroup (str, optional): The Athena workgroup to use. If None, uses the server's default.
+            output_location (str, optional): S3 location to store query results. If None, uses the server's default.
+            wait_for_completion (bool): Whether to wait for all queries to complete
+
+        Returns:
+            List[dict]: Execution details for each query, in input order
+        """
+        if not queries:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), 16)) as executor:
+            futures = [
+                executor.submit(
+                    self.execute_athena_query,
+                    query_string=query,
+                    workgroup=workgroup,
+                    output_location=output_location,
+                    wait_for_completion=wait_for_completion
+                )
+                for query in queries
+            ]
+            return [future.result() for future in futures]
+
+    def _wait_for_query(self, query_execution_id: str, max_attempts: int = 100) -> dict:
+        """
+        Wait for an Athena query to reach a terminal state
+
+        Polls immediately after submission so sub-second queries return
+        right away, then backs off exponentially from 200 ms up to a 2 s
+        cap so long-running queries don't hammer the API.
+
+        Args:
+            query_execution_id (str): The execution ID of the query to wait for
+            max_attempts (int): Maximum number of status checks
+
+        Returns:
+            dict: Final query status, plus the results if the query succeeded
+        """
+        status = 'QUEUED'
+        for attempt in range(max_attempts):
+            status_response = self.athena_client.get_query_execution(
+                QueryExecutionId=query_execution_id
+            )
+            status = status_response['QueryExecution']['Status']['State']
+            if status not in ('QUEUED', 'RUNNING'):
+                break
+            time.sleep(min(0.2 * (1.5 ** attempt), 2.0))
+
+        result = {'Status': status}
+
+        # Get results if query succeeded
+        if status == 'SUCCEEDED':
+            result['Results'] = self.athena_client.get_query_results(
+                QueryExecutionId=query_execution_id
+            )
+        return result
+
     def get_athena_query_results(self, query_execution_id: str, max_results: int = 1000) -> dict:
         """
         Get the results of a previously executed Athena query
@@ -230,9 +413,9 @@ class AWSResourceQuerier:
             dict: Query results and metadata
         """
         try:
-            # Create Athena client
-            athena_client = self.session.client('athena')
-            
+            # Reuse the cached Athena client
+            athena_client = self.athena_client
+
             # Check query status first
             status_response = athena_client.get_query_execution(
                 QueryExecutionId=query_execution_id
@@ -253,38 +436,46 @@ class AWSResourceQuerier:
             
             # Only get results if query succeeded
             if status == 'SUCCEEDED':
-                results_response = athena_client.get_query_results(
+                # Page through the results so only one page of the raw boto3
+                # response is held in memory at a time
+                paginator = athena_client.get_paginator('get_query_results')
+                page_iterator = paginator.paginate(
                     QueryExecutionId=query_execution_id,
-                    MaxResults=max_results
+                    PaginationConfig={
+                        'MaxItems': max_results,
+                        'PageSize': min(max_results, 1000)
+                    }
                 )
-                
-                # Process column info
+
                 column_info = []
-                if 'ResultSet' in results_response and 'ResultSetMetadata' in results_response['ResultSet']:
-                    for col in results_response['ResultSet']['ResultSetMetadata'].get('ColumnInfo', []):
-                        column_info.append({
-                            'Name': col.get('Name', ''),
-                            'Type': col.get('Type', '')
-                        })
-                
-                # Process rows
+                col_names = []
                 rows = []
-                if 'ResultSet' in results_response and 'Rows' in results_response['ResultSet']:
-                    header_processed = False
-                    
-                    for row in results_response['ResultSet']['Rows']:
-                        if not header_processed:
-                            # Skip header row
-                            header_processed = True
-                            continue
-                            
-                        data = {}
-                        for i, col_info in enumerate(column_info):
-                            if i < len(row['Data']):
-                                data[col_info['Name']] = row['Data'][i].get('VarCharValue', '')
-                        
-                        rows.append(data)
-                
+
+                for page_number, page in enumerate(page_iterator):
+                    result_set = page.get('ResultSet', {})
+
+                    # Column metadata is repeated on every page; keep the first
+                    if not column_info and 'ResultSetMetadata' in result_set:
+                        for col in result_set['ResultSetMetadata'].get('ColumnInfo', []):
+                            column_info.append({
+                                'Name': col.get('Name', ''),
+                                'Type': col.get('Type', '')
+                            })
+                        col_names = [col['Name'] for col in column_info]
+
+                    page_rows = result_set.get('Rows', [])
+                    if page_number == 0:
+                        # Skip header row (first row of the first page)
+                        page_rows = page_rows[1:]
+
+                    for row in page_rows:
+                        # zip stops at the shorter sequence, which also covers
+                        # rows with fewer cells than columns
+                        rows.append({
+                            name: cell.get('VarCharValue', '')
+                            for name, cell in zip(col_names, row['Data'])
+                        })
+
                 result['ColumnInfo'] = column_info
                 result['Rows'] = rows
                 result['RowCount'] = len(rows)
@@ -295,77 +486,6 @@ class AWSResourceQuerier:
             logger.error(f"Error getting Athena query results: {str(e)}")
             return {"error": str(e)}
 
-    # def execute_query(self, code_snippet: str) -> str:
-    #     """
-    #     Execute a boto3 code snippet and return the results
-
-    #     Args:
-    #         code_snippet (str): Python code using boto3 to query AWS resources
-
-    #     Returns:
-    #         str: JSON string containing the query results or error message
-    #     """
-    #     try:
-    #         # Parse the code into an AST
-    #         tree = ast.parse(code_snippet)
-
-    #         # Analyze the code
-    #         executor = CodeExecutor()
-    #         executor.visit(tree)
-
-    #         # Validate imports
-    #         allowed_modules = {'boto3', 'operator', 'json', 'datetime', 'pytz', 'dateutil', 're', 'time'}
-    #         unauthorized_imports = executor.imported_modules - allowed_modules
-    #         if unauthorized_imports:
-    #             return json.dumps({
-    #                 "error": f"Unauthorized imports: {', '.join(unauthorized_imports)}. "
-    #                         f"Only {', '.join(allowed_modules)} are allowed."
-    #             })
-
-    #         # Create execution namespace
-    #         local_ns = {
-    #             'boto3': boto3,
-    #             'session': self.session,
-    #             'result': None,
-    #             'itemgetter': itemgetter,
-    #             '__builtins__': {
-    #                 name: getattr(__builtins__, name)
-    #                 for name in [
-    #                     'dict', 'list', 'tuple', 'set', 'str', 'int', 'float', 'bool',
-    #                     'len', 'max', 'min', 'sorted', 'filter', 'map', 'sum', 'any', 'all',
-    #                     '__import__', 'hasattr', 'getattr', 'isinstance', 'print'
-    #                 ]
-    #             }
-    #         }
-
-    #         # Compile and execute the code
-    #         compiled_code = compile(tree, '<string>', 'exec')
-    #         exec(compiled_code, local_ns)
-
-    #         # Get the result
-    #         result = local_ns.get('result')
-
-    #         # Validate result was set
-    #         if not executor.has_result:
-    #             return json.dumps({
-    #                 "error": "Code must set a 'result' variable with the query output"
-    #             })
-
-    #         # Convert result to JSON-serializable format
-    #         if result is not None:
-    #             if hasattr(result, 'to_dict'):
-    #                 result = result.to_dict()
-    #             return json.dumps(result, default=str)
-    #         else:
-    #             return json.dumps({"error": "Result cannot be None"})
-
-    #     except SyntaxError as e:
-    #         logger.error(f"Syntax error in code: {str(e)}")
-    #         return json.dumps({"error": f"Syntax error: {str(e)}"})
-    #     except Exception as e:
-    #         logger.error(f"Error executing query: {str(e)}")
-    #         return json.dumps({"error": str(e)})
-
 async def main():
     """Run the AWS Resources MCP server."""
     logger.info("Server starting")
@@ -388,7 +508,7 @@ async def main():
 
     @server.list_resources()
     async def handle_list_resources() -> list[types.Resource]:
-        return []
+        return _EMPTY_RESOURCES
 
     @server.read_resource()
     async def handle_read_resource(uri: AnyUrl) -> str:
@@ -397,68 +517,7 @@ async def main():
     @server.list_tools()
     async def handle_list_tools() -> list[types.Tool]:
         """List available tools"""
-        return [
-            # types.Tool(
-            #     name="aws_resources_query_or_modify",
-            #     description="Execute a boto3 code snippet to query or modify AWS resources",
-            #     inputSchema={
-            #         "type": "object",
-            #         "properties": {
-            #             "code_snippet": {
-            #                 "type": "string",
-            #                 "description": "Python code using boto3 to query or modify AWS resources. The code should have default execution setting variable named 'result'. Example code: 'result = boto3.client('s3').list_buckets()' or for Athena: 'athena_client = session.client(\"athena\"); response = athena_client.start_query_execution(QueryString=\"select * from prod.historical_risks limit 10;\", WorkGroup=\"superset\", ResultConfiguration={\"OutputLocation\": \"s3://cynerio-athena-results/query-results/\"}); result = {\"QueryExecutionId\": response[\"QueryExecutionId\"], \"OutputLocation\": f\"s3://cynerio-athena-results/query-results/{response[\"QueryExecutionId\"]}.csv\"}'"
-            #             }
-            #         },
-            #         "required": ["code_snippet"]
-            #     },
-            # ),
-            types.Tool(
-                name="aws_athena_query",
-                description="Execute an Athena SQL query and return the execution details",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query_string": {
-                            "type": "string",
-                            "description": "The SQL query to execute in Athena"
-                        },
-                        "workgroup": {
-                            "type": "string",
-                            "description": "The Athena workgroup to use. If not provided, uses the server's configured default."
-                        },
-                        "output_location": {
-                            "type": "string",
-                            "description": "S3 location to store query results. If not provided, uses the server's configured default."
-                        },
-                        "wait_for_completion": {
-                            "type": "boolean",
-                            "description": "Whether to wait for query completion",
-                            "default": False
-                        }
-                    },
-                    "required": ["query_string"]
-                },
-            ),
-            types.Tool(
-                name="aws_athena_get_query_results",
-                description="Get the results of a previously executed Athena query",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query_execution_id": {
-                            "type": "string",
-                            "description": "The execution ID of the query to get results for"
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of results to return",
-                            "default": 1000
-                        }
-                    },
-                    "required": ["query_execution_id"]
-                },
-            )
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def handle_call_tool(
@@ -466,12 +525,10 @@ async def main():
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
         """Handle tool execution requests"""
         try:
-            # if name == "aws_resources_query_or_modify":
-            #     if not arguments or "code_snippet" not in arguments:
-            #         raise ValueError("Missing code_snippet argument")
+            # Run blocking boto3 work in the querier's thread pool so
+            # concurrent tool calls don't serialize on the event loop
+            loop = asyncio.get_running_loop()
 
-            #     results = aws_querier.execute_query(arguments["code_snippet"])
-            #     return [types.TextContent(type="text", text=str(results))]
             if name == "aws_athena_query":
                 if not arguments or "query_string" not in arguments:
                     raise ValueError("Missing query_string argument")
@@ -483,14 +540,41 @@ async def main():
                 wait_for_completion = arguments.get("wait_for_completion", False)
                 
                 # Execute the Athena query
-                result = aws_querier.execute_athena_query(
-                    query_string=query_string,
-                    workgroup=workgroup,
-                    output_location=output_location,
-                    wait_for_completion=wait_for_completion
+                result = await loop.run_in_executor(
+                    aws_querier._pool,
+                    functools.partial(
+                        aws_querier.execute_athena_query,
+                        query_string=query_string,
+                        workgroup=workgroup,
+                        output_location=output_location,
+                        wait_for_completion=wait_for_completion
+                    )
                 )
                 
-                return [types.TextContent(type="text", text=json.dumps(result, default=str))]
+                return [types.TextContent(type="text", text=_json_dumps(result))]
+            elif name == "aws_athena_query_batch":
+                if not arguments or "queries" not in arguments:
+                    raise ValueError("Missing queries argument")
+
+                # Extract arguments with defaults
+                queries = arguments["queries"]
+                workgroup = arguments.get("workgroup")  # Will use server default if None
+                output_location = arguments.get("output_location")  # Will use server default if None
+                wait_for_completion = arguments.get("wait_for_completion", False)
+
+                # Execute the Athena queries concurrently
+                result = await loop.run_in_executor(
+                    aws_querier._pool,
+                    functools.partial(
+                        aws_querier.execute_athena_queries,
+                        queries=queries,
+                        workgroup=workgroup,
+                        output_location=output_location,
+                        wait_for_completion=wait_for_completion
+                    )
+                )
+
+                return [types.TextContent(type="text", text=_json_dumps(result))]
             elif name == "aws_athena_get_query_results":
                 if not arguments or "query_execution_id" not in arguments:
                     raise ValueError("Missing query_execution_id argument")
@@ -500,12 +584,16 @@ async def main():
                 max_results = arguments.get("max_results", 1000)
                 
                 # Get the Athena query results
-                result = aws_querier.get_athena_query_results(
-                    query_execution_id=query_execution_id,
-                    max_results=max_results
+                result = await loop.run_in_executor(
+                    aws_querier._pool,
+                    functools.partial(
+                        aws_querier.get_athena_query_results,
+                        query_execution_id=query_execution_id,
+                        max_results=max_results
+                    )
                 )
                 
-                return [types.TextContent(type="text", text=json.dumps(result, default=str))]
+                return [types.TextContent(type="text", text=_json_dumps(result))]
             else:
                 raise ValueError(f"Unknown tool: {name}")
 
@@ -528,5 +616,4 @@ async def main():
         )
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())